@@ -1,13 +1,47 @@
 # -*- coding: utf-8 -*-
-import pandas as pd
-from flask import Flask, jsonify, request
+import orjson
+import polars as pl
+from flask import Flask, Response, jsonify, request
+from flask.json.provider import DefaultJSONProvider
 from flask_swagger_ui import get_swaggerui_blueprint
 import os
 import glob
-from collections import defaultdict
-import re
+import hashlib
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+import logging
+import sys
+from bisect import bisect_left, bisect_right
+
+import hierarquia
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Provedor JSON do Flask que usa o orjson (mantém as chaves ordenadas, como o padrão)."""
+
+    opcoes = orjson.OPT_NON_STR_KEYS | orjson.OPT_SORT_KEYS
+
+    def _dumps_bytes(self, obj, indent=None):
+        opcoes = self.opcoes | orjson.OPT_INDENT_2 if indent else self.opcoes
+        return orjson.dumps(obj, default=self.default, option=opcoes)
+
+    def dumps(self, obj, **kwargs):
+        return self._dumps_bytes(obj, kwargs.get('indent')).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        # Gera os bytes diretamente, sem passar por str
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        return self._app.response_class(self._dumps_bytes(obj, indent) + b"\n", mimetype=self.mimetype)
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
+
+# Mensagens de depuração do processamento das planilhas (CRONOGRAMA_DEBUG=1 para exibir)
+if os.environ.get('CRONOGRAMA_DEBUG') == '1':
+    app.logger.setLevel(logging.DEBUG)
 
 # --- Configuração do Swagger ---
 SWAGGER_URL = '/api/docs'
@@ -19,55 +53,117 @@ swaggerui_blueprint = get_swaggerui_blueprint(
 )
 app.register_blueprint(swaggerui_blueprint, url_prefix=SWAGGER_URL)
 
-# --- Variável para armazenar o cronograma processado ---
+# --- Variáveis para armazenar o cronograma processado e seu índice de busca ---
 cronograma_final = {}
+cronograma_json = b''
+indice_busca = {}
+
+# Diretório onde o cronograma processado é guardado entre reinicializações
+CACHE_DIR = 'cache'
+
+# Separador entre os caminhos de busca no corpus do índice
+SEPARADOR_BUSCA = '\x00'
+
+# Colunas das planilhas efetivamente lidas pelo processamento
+COLUNAS_USADAS = ['semana', 'dia', 'tema do dia', 'aula', 'link aula', 'link gratuito']
 
 # --- Funções Auxiliares ---
 
-def criar_chave_semana(semana_str):
-    """
-    Cria uma chave única e limpa para a semana (ex: "Semana 1 (..)" -> "semana_1").
-    Retorna None se não encontrar um número.
+def internar_strings(obj):
     """
-    numeros = re.findall(r'\d+', semana_str)
-    if numeros:
-        return f"semana_{numeros[0]}"
-    return None
-
-def extrair_periodo(semana_str):
-    """Extrai o período da string da semana (ex: "Semana 1 (15/09 a 21/09)..." -> "15/09 a 21/09")"""
-    match = re.search(r'\((.*?)\)', semana_str)
-    if match:
-        return match.group(1)
-    return ""
-
-def extrair_area_conhecimento(semana_str):
-    """Extrai a área de conhecimento da string da semana (ex: "...Médica" -> "Clínica Médica")"""
-    partes = re.split(r'\)\s*', semana_str, 1)
-    if len(partes) > 1:
-        return partes[1].strip()
-    return ""
-
-def extrair_tema_subtema(tema_completo_str):
+    Percorre o cronograma e troca cada string (chaves e valores) pela versão internada,
+    para que nomes repetidos (áreas, dias, temas) sejam um único objeto em memória.
     """
-    Divide a string 'Tema do dia' em Tema Principal e Subtema.
-    Ex: "Cardiologia - Hipertensão Arterial Sistêmica" -> ("Cardiologia", "Hipertensão Arterial Sistêmica")
-    """
-    if ' - ' in tema_completo_str:
-        partes = tema_completo_str.split(' - ', 1)
-        return partes[0].strip(), partes[1].strip()
-    return tema_completo_str.strip(), ""
+    if isinstance(obj, str):
+        return sys.intern(obj)
+    if isinstance(obj, dict):
+        return {sys.intern(chave): internar_strings(valor) for chave, valor in obj.items()}
+    if isinstance(obj, list):
+        return [internar_strings(item) for item in obj]
+    return obj
 
 # --- Funções de Processamento de Dados ---
 
+def carregar_arquivo(arquivo):
+    """
+    Lê um arquivo .xlsx ou .csv e devolve o DataFrame com as colunas usadas já normalizadas.
+    Retorna None se o arquivo estiver vazio.
+    """
+    # Lê tudo como texto, sem inferência de tipos
+    if arquivo.endswith('.xlsx'):
+        df = pl.read_excel(arquivo, engine='calamine', infer_schema_length=0, raise_if_empty=False)
+    else:
+        df = pl.read_csv(arquivo, infer_schema=False)
+
+    # Normaliza os nomes das colunas
+    df = df.rename({col: col.strip().lower() for col in df.columns})
+
+    if df.is_empty() or not any(col in df.columns for col in COLUNAS_USADAS):
+        print(f"Atenção: O arquivo '{os.path.basename(arquivo)}' está vazio ou não pôde ser lido corretamente.")
+        return None
+
+    app.logger.debug("Colunas normalizadas no arquivo '%s': %s", os.path.basename(arquivo), df.columns)
+
+    # Mantém apenas as colunas usadas (as ausentes, como 'aula', ficam vazias), sem nulos
+    # nem espaços nas pontas, e troca espaços por '_' nos nomes
+    df = df.select([
+        (pl.col(col).fill_null('').str.strip_chars() if col in df.columns else pl.lit('')).alias(col.replace(' ', '_'))
+        for col in COLUNAS_USADAS
+    ])
+    # Formatar o DataFrame é caro, então só é feito com o log de depuração ativo
+    if app.logger.isEnabledFor(logging.DEBUG):
+        app.logger.debug("Arquivo '%s' lido com sucesso. Primeiras 5 linhas:\n%s",
+                         os.path.basename(arquivo), df.head())
+    return df
+
+def caminho_do_cache(arquivos):
+    """
+    Monta o caminho do cache a partir dos arquivos de entrada e de suas datas de modificação
+    (incluindo os módulos do processamento, para que mudanças no código invalidem o cache).
+    """
+    assinatura = tuple(sorted((f, os.path.getmtime(f)) for f in arquivos + [__file__, hierarquia.__file__]))
+    chave = hashlib.sha256(repr(assinatura).encode('utf-8')).hexdigest()
+    return os.path.join(CACHE_DIR, f"{chave}.pkl")
+
+def ler_cache(caminho):
+    """Lê o cronograma já processado do cache. Retorna None se não houver cache válido."""
+    try:
+        with open(caminho, 'rb') as f:
+            return pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"Cache '{caminho}' ignorado: {e}")
+        return None
+
+def salvar_cache(caminho, cronograma):
+    """
+    Grava o cronograma processado no cache (escrita atômica para não expor arquivo parcial)
+    e apaga os caches antigos.
+    """
+    try:
+        os.makedirs(os.path.dirname(caminho), exist_ok=True)
+        temporario = f"{caminho}.{os.getpid()}.tmp"
+        with open(temporario, 'wb') as f:
+            pickle.dump(cronograma, f, protocol=5)
+        os.replace(temporario, caminho)
+    except OSError as e:
+        print(f"Não foi possível gravar o cache '{caminho}': {e}")
+        return
+
+    # Remove os caches de versões anteriores dos arquivos, que não serão mais lidos
+    for antigo in glob.glob(os.path.join(os.path.dirname(caminho), '*.pkl')):
+        if antigo != caminho:
+            try:
+                os.remove(antigo)
+            except OSError as e:
+                print(f"Não foi possível remover o cache antigo '{antigo}': {e}")
+
 def processar_arquivos_para_hierarquia():
     """
     Processa arquivos na raiz do projeto e constrói uma estrutura hierárquica agrupada por
-    'area_conhecimento'.
+    'area_conhecimento'. Reaproveita o resultado em cache se os arquivos não mudaram.
     """
-    # Usamos defaultdict para criar listas vazias automaticamente para cada nova área
-    dados_brutos = defaultdict(list)
-
     # Busca arquivos .xlsx e .csv diretamente na raiz do projeto
     arquivos = glob.glob('*.xlsx') + glob.glob('*.csv')
     
@@ -77,134 +173,157 @@ def processar_arquivos_para_hierarquia():
     else:
         print(f"Arquivos encontrados: {arquivos}")
 
-    for arquivo in arquivos:
-        try:
-            df = pd.read_excel(arquivo) if arquivo.endswith('.xlsx') else pd.read_csv(arquivo)
-            
-            if df.empty:
-                print(f"Atenção: O arquivo '{os.path.basename(arquivo)}' está vazio ou não pôde ser lido corretamente.")
-                continue
+    caminho_cache = caminho_do_cache(arquivos)
+    cronograma = ler_cache(caminho_cache)
+    if cronograma is not None:
+        print(f"Cronograma carregado do cache '{caminho_cache}'.")
+        return cronograma
 
-            # Normaliza os nomes das colunas
-            df.columns = [col.strip().lower() for col in df.columns]
-            print(f"Colunas normalizadas no arquivo '{os.path.basename(arquivo)}': {df.columns.tolist()}")
-
-            df = df.astype(str).fillna('')
-            print(f"Arquivo '{os.path.basename(arquivo)}' lido com sucesso. Primeiras 5 linhas:")
-            print(df.head().to_string())
-
-            for _, row in df.iterrows():
-                semana_str = row.get('semana', '').strip()
-                dia_str = row.get('dia', '').strip()
-                tema_completo_str = row.get('tema do dia', '').strip()
-                aula_str = row.get('aula', '').strip() # Esta coluna pode não existir na nova planilha, o que está ok.
-
-                chave_semana = criar_chave_semana(semana_str)
-                area_conhecimento_str = extrair_area_conhecimento(semana_str)
-
-                # Pula a linha se não conseguir a area, a chave da semana ou se o dia/tema estiverem vazios
-                if not area_conhecimento_str or not chave_semana or not dia_str or not tema_completo_str:
-                    continue
-
-                tema_principal_str, subtema_str = extrair_tema_subtema(tema_completo_str)
-                
-                # --- Constrói a hierarquia de TEMAS e SUBTEMAS ---
-                # A lógica abaixo cria a estrutura aninhada, mas de forma separada
-                # para cada linha da planilha.
-                
-                temas_lista = []
-                subtemas_lista = []
-                aulas_lista = []
-                
-                aula_nova = {
-                    "nome": aula_str,
-                    "link_aula": row.get('link aula', '').strip(),
-                    "link_gratuito": row.get('link gratuito', '').strip()
-                }
-                aulas_lista.append(aula_nova)
-
-                subtema_obj = {
-                    "nome": subtema_str,
-                    "aulas": aulas_lista
-                }
-                subtemas_lista.append(subtema_obj)
-
-                tema_obj = {
-                    "nome": tema_principal_str,
-                    "subtemas": subtemas_lista
-                }
-                temas_lista.append(tema_obj)
-                
-                dia_obj = {
-                    "semana": chave_semana,
-                    "nome": dia_str,
-                    "temas": temas_lista
-                }
-                
-                # Adiciona o dia ao dicionário principal, agrupando por area_conhecimento
-                # O defaultdict 'dados_brutos' garante que a lista para a área já existe
-                dados_brutos[area_conhecimento_str].append(dia_obj)
-
-        except Exception as e:
-            print(f"Erro ao processar o arquivo {arquivo}: {e}")
-            return {} # Retorna vazio se houver um erro de leitura
-
-    return formatar_cronograma_final(dados_brutos)
-
-def formatar_cronograma_final(dados_brutos):
+    cronograma = construir_hierarquia(arquivos)
+    if cronograma:
+        salvar_cache(caminho_cache, cronograma)
+    return cronograma
+
+def construir_hierarquia(arquivos):
     """
-    Consolida as listas de dias para cada área e remove entradas duplicadas.
+    Lê os arquivos e constrói a estrutura hierárquica agrupada por 'area_conhecimento'.
     """
-    cronograma_ordenado = {}
-    
-    for area_conhecimento, dias_lista in dados_brutos.items():
-        # Usa um set para rastrear dias já vistos e evitar duplicatas
-        dias_processados = {} # Usamos um dicionário para consolidar temas e subtemas
-        
-        for dia in dias_lista:
-            dia_key = dia['nome']
-            if dia_key not in dias_processados:
-                dias_processados[dia_key] = {
-                    "semana": dia['semana'],
-                    "nome": dia['nome'],
-                    "temas": defaultdict(lambda: {
-                        "nome": "",
-                        "subtemas": defaultdict(lambda: {
-                            "nome": "",
-                            "aulas": []
+    # Lê os arquivos em paralelo; a ordem dos resultados segue a de 'arquivos'
+    dfs = []
+    with ThreadPoolExecutor(max_workers=min(8, len(arquivos))) as executor:
+        futuros = [executor.submit(carregar_arquivo, arquivo) for arquivo in arquivos]
+        for arquivo, futuro in zip(arquivos, futuros):
+            try:
+                df = futuro.result()
+            except Exception as e:
+                print(f"Erro ao processar o arquivo {arquivo}: {e}")
+                return {} # Retorna vazio se houver um erro de leitura
+            if df is not None:
+                dfs.append(df)
+
+    if not dfs:
+        return {"cronograma": {}}
+
+    df = pl.concat(dfs, how='vertical')
+
+    # Extrai chave da semana, área, tema e subtema de uma vez por coluna:
+    #   chave_semana:      primeiro número da semana ("Semana 1 (..)" -> "semana_1"; sem número -> "")
+    #   area_conhecimento: o que vem depois do ')' ("Semana 1 (15/09 a 21/09) Clínica Médica" -> "Clínica Médica")
+    #   tema/subtema:      divisão no primeiro ' - ' ("Cardiologia - Hipertensão" -> ("Cardiologia", "Hipertensão");
+    #                      sem ' - ' o subtema fica "")
+    semana = pl.col('semana')
+    df = df.with_columns(
+        chave_semana=pl.concat_str([pl.lit('semana_'), semana.str.extract(r'(\d+)', 1)]).fill_null(''),
+        area_conhecimento=semana.str.extract(r'\)\s*((?s:.*))', 1).fill_null('').str.strip_chars(),
+        partes_tema=pl.col('tema_do_dia').str.splitn(' - ', 2)
+    ).with_columns(
+        tema_principal=pl.col('partes_tema').struct.field('field_0').fill_null('').str.strip_chars(),
+        subtema=pl.col('partes_tema').struct.field('field_1').fill_null('').str.strip_chars()
+    ).drop('partes_tema')
+
+    return formatar_cronograma_final(df)
+
+def formatar_cronograma_final(df):
+    """
+    Remove linhas inválidas e entradas duplicadas e monta a hierarquia
+    área -> dias -> temas -> subtemas -> aulas (na ordem em que aparecem nos arquivos).
+    """
+    # Pula as linhas sem area, chave da semana, dia ou tema
+    df = df.filter(
+        (pl.col('area_conhecimento') != '') & (pl.col('chave_semana') != '')
+        & (pl.col('dia') != '') & (pl.col('tema_do_dia') != '')
+    ).unique(subset=[
+        'area_conhecimento', 'dia', 'tema_principal', 'subtema', 'aula', 'link_aula', 'link_gratuito'
+    ], keep='first', maintain_order=True)
+
+    # As colunas vão como listas de str para o montador da hierarquia
+    colunas = [
+        'area_conhecimento', 'chave_semana', 'dia', 'tema_principal', 'subtema', 'aula', 'link_aula', 'link_gratuito'
+    ]
+    return {"cronograma": hierarquia.montar_hierarquia(*(df.get_column(col).to_list() for col in colunas))}
+
+def construir_indice_busca(cronograma):
+    """
+    Pré-calcula as strings de busca (já em minúsculas) e os registros de resultado do
+    endpoint /api/buscar.
+
+    Os caminhos completos de todas as aulas ficam concatenados em um único 'corpus',
+    separados por SEPARADOR_BUSCA, para que cada consulta seja uma varredura com str.find.
+    Em 'areas', cada item é (area_busca, resultados_da_area, resumo_da_area, dias), e cada
+    dia é (dia_busca, resultado_do_dia, inicio, fim), com o intervalo das suas aulas em 'aulas'.
+    """
+    areas = []
+    caminhos = []
+    resultados_aulas = []
+    for area_conhecimento, dias in cronograma.get("cronograma", {}).items():
+        area_busca = area_conhecimento.lower()
+        resultados_area = []
+        dias_indice = []
+        for dia in dias:
+            resultado_dia = {
+                "semana": dia['semana'],
+                "dia": dia['nome'],
+                "area_conhecimento": area_conhecimento,
+                "temas": dia.get('temas', []),
+                "aula_encontrada": []
+            }
+            resultados_area.append(resultado_dia)
+
+            inicio = len(resultados_aulas)
+            for tema in dia.get("temas", []):
+                for subtema in tema.get("subtemas", []):
+                    for aula in subtema.get("aulas", []):
+                        # String de busca com todo o caminho
+                        caminhos.append(f"{area_busca} {dia['nome']} {tema['nome']} {subtema['nome']} {aula['nome']}".lower())
+                        resultados_aulas.append({
+                            "area_conhecimento": area_conhecimento,
+                            "semana": dia['semana'],
+                            "dia": dia['nome'],
+                            "tema": tema['nome'],
+                            "subtema": subtema['nome'],
+                            "aula_encontrada": aula
                         })
-                    })
-                }
-
-            # Consolida temas e subtemas no mesmo dia
-            for tema in dia['temas']:
-                tema_key = tema['nome']
-                if tema_key not in dias_processados[dia_key]['temas']:
-                    dias_processados[dia_key]['temas'][tema_key]['nome'] = tema_key
-                
-                for subtema in tema['subtemas']:
-                    subtema_key = subtema['nome']
-                    if subtema_key not in dias_processados[dia_key]['temas'][tema_key]['subtemas']:
-                        dias_processados[dia_key]['temas'][tema_key]['subtemas'][subtema_key]['nome'] = subtema_key
-                    
-                    for aula in subtema['aulas']:
-                        if aula not in dias_processados[dia_key]['temas'][tema_key]['subtemas'][subtema_key]['aulas']:
-                             dias_processados[dia_key]['temas'][tema_key]['subtemas'][subtema_key]['aulas'].append(aula)
-
-        
-        # Converte a estrutura de volta para listas
-        dias_finais = list(dias_processados.values())
-        for dia_final in dias_finais:
-            temas_lista = []
-            for tema_obj in dia_final['temas'].values():
-                subtemas_lista = list(tema_obj['subtemas'].values())
-                tema_obj['subtemas'] = subtemas_lista
-                temas_lista.append(tema_obj)
-            dia_final['temas'] = temas_lista
-            
-        cronograma_ordenado[area_conhecimento] = dias_finais
-    
-    return {"cronograma": cronograma_ordenado}
+            dias_indice.append((f"{dia['nome']}".lower(), resultado_dia, inicio, len(resultados_aulas)))
+        resumo_area = {
+            "area_conhecimento": area_conhecimento,
+            "dias": [dia['nome'] for dia in dias]
+        }
+        areas.append((area_busca, resultados_area, resumo_area, dias_indice))
+
+    # Posição inicial de cada caminho dentro do corpus
+    inicios = []
+    posicao = 0
+    for caminho in caminhos:
+        inicios.append(posicao)
+        posicao += len(caminho) + len(SEPARADOR_BUSCA)
+
+    return {
+        "areas": areas,
+        "corpus": SEPARADOR_BUSCA.join(caminhos),
+        "inicios": inicios,
+        "aulas": resultados_aulas
+    }
+
+def buscar_aulas(indice, termo):
+    """
+    Retorna, em ordem crescente, as posições em indice['aulas'] cujo caminho de busca contém o termo.
+    """
+    # Os caminhos não contêm o separador, então um termo com ele nunca é encontrado
+    if SEPARADOR_BUSCA in termo:
+        return []
+
+    corpus = indice["corpus"]
+    inicios = indice["inicios"]
+    encontradas = []
+    posicao = corpus.find(termo)
+    while posicao != -1:
+        aula = bisect_right(inicios, posicao) - 1
+        encontradas.append(aula)
+        # Continua a partir da próxima aula, para não contar a mesma duas vezes
+        if aula + 1 == len(inicios):
+            break
+        posicao = corpus.find(termo, inicios[aula + 1])
+    return encontradas
 
 # --- Endpoints da API ---
 
@@ -233,7 +352,8 @@ def get_cronograma_completo():
           Estrutura completa do cronograma, onde a chave de cada semana
           é um identificador único (ex: 'semana_1').
     """
-    return jsonify(cronograma_final)
+    # O cronograma não muda depois da inicialização, então é serializado uma única vez
+    return Response(cronograma_json, mimetype='application/json')
 
 @app.route('/api/buscar', methods=['GET'])
 def buscar():
@@ -248,6 +368,13 @@ def buscar():
         type: string
         required: true
         description: Termo a ser buscado (ex: 'Cardiologia', 'Clínica Médica', '15/09').
+      - name: brief
+        in: query
+        type: string
+        required: false
+        description: >
+          Com 'brief=1', cada área que corresponde ao termo retorna apenas o nome da
+          área e a lista de dias, em vez de um resultado com os temas de cada dia.
     responses:
       200:
         description: Uma lista de resultados encontrados.
@@ -257,57 +384,35 @@ def buscar():
     termo = request.args.get('q', '').lower()
     if not termo:
         return jsonify({"error": "Parâmetro de busca 'q' é obrigatório"}), 400
+    resumo = request.args.get('brief') == '1'
 
-    resultados = []
-    # Itera sobre os valores do dicionário de semanas
-    for area_conhecimento, dias in cronograma_final.get("cronograma", {}).items():
-        # Constrói uma string com os dados da area de conhecimento para busca
-        area_busca = area_conhecimento.lower()
+    aulas_encontradas = buscar_aulas(indice_busca, termo)
+    resultados_aulas = indice_busca["aulas"]
 
+    resultados = []
+    for area_busca, resultados_area, resumo_area, dias in indice_busca["areas"]:
         if termo in area_busca:
-             # Se o termo for encontrado na area, adiciona todos os dias
-             for dia in dias:
-                 resultados.append({
-                    "semana": dia['semana'],
-                    "dia": dia['nome'],
-                    "area_conhecimento": area_conhecimento,
-                    "temas": [t for t in dia.get('temas', [])],
-                    "aula_encontrada": []
-                 })
-             continue
-        
-        for dia in dias:
-            dia_busca = f"{dia['nome']}".lower()
+            # Se o termo for encontrado na area, adiciona todos os dias (ou só o resumo da área)
+            if resumo:
+                resultados.append(resumo_area)
+            else:
+                resultados.extend(resultados_area)
+            continue
+
+        for dia_busca, resultado_dia, inicio, fim in dias:
             if termo in dia_busca:
-                resultados.append({
-                    "semana": dia['semana'],
-                    "dia": dia['nome'],
-                    "area_conhecimento": area_conhecimento,
-                    "temas": [t for t in dia.get('temas', [])],
-                    "aula_encontrada": []
-                })
+                resultados.append(resultado_dia)
                 continue
-            for tema in dia.get("temas", []):
-                for subtema in tema.get("subtemas", []):
-                    for aula in subtema.get("aulas", []):
-                        # Constrói uma string de busca com todo o caminho
-                        caminho_completo = f"{area_busca} {dia['nome']} {tema['nome']} {subtema['nome']} {aula['nome']}".lower()
-                        if termo in caminho_completo:
-                            resultados.append({
-                                "area_conhecimento": area_conhecimento,
-                                "semana": dia['semana'],
-                                "dia": dia['nome'],
-                                "tema": tema['nome'],
-                                "subtema": subtema['nome'],
-                                "aula_encontrada": aula
-                            })
-                            
+            # Aulas do dia que contêm o termo
+            primeira = bisect_left(aulas_encontradas, inicio)
+            ultima = bisect_left(aulas_encontradas, fim, primeira)
+            resultados.extend(resultados_aulas[i] for i in aulas_encontradas[primeira:ultima])
+
     return jsonify({"resultados": resultados})
 
-@app.route('/static/swagger.json')
-def swagger_spec():
-    """Serve a especificação OpenAPI para a UI do Swagger."""
-    spec = {
+def especificacao_swagger():
+    """Monta a especificação OpenAPI servida para a UI do Swagger."""
+    return {
         "openapi": "3.0.0",
         "info": {
             "title": "API Cronograma de Estudos (Dicionário)",
@@ -319,11 +424,20 @@ def swagger_spec():
             "/api/buscar": { "get": buscar.__doc__ }
         }
     }
-    return jsonify(spec)
+
+# A especificação é estática: serializada uma vez na carga do módulo
+swagger_json = orjson.dumps(especificacao_swagger(), option=orjson.OPT_SORT_KEYS)
+
+@app.route('/static/swagger.json')
+def swagger_spec():
+    """Serve a especificação OpenAPI para a UI do Swagger."""
+    return Response(swagger_json, mimetype='application/json')
 
 # --- Inicialização ---
 print("Processando arquivos do cronograma...")
-cronograma_final = processar_arquivos_para_hierarquia()
+cronograma_final = internar_strings(processar_arquivos_para_hierarquia())
+cronograma_json = orjson.dumps(cronograma_final, option=orjson.OPT_SORT_KEYS)
+indice_busca = construir_indice_busca(cronograma_final)
 
 if __name__ == '__main__':
     if cronograma_final.get("cronograma"):
@@ -336,5 +450,6 @@ if __name__ == '__main__':
     else:
         print("Erro: A função de processamento de arquivos não retornou o dicionário esperado.")
 
+    # Servidor de desenvolvimento; em produção a aplicação roda no gunicorn via wsgi.py
     port = int(os.environ.get('PORT', 5000))
-    app.run(host='0.0.0.0', port=port, debug=True)
+    app.run(host='0.0.0.0', port=port, debug=os.environ.get('FLASK_DEBUG') == '1')
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+"""
+Montagem da hierarquia área -> dias -> temas -> subtemas -> aulas do cronograma.
+
+Recebe só listas de str, sem depender do polars nem do Flask.
+"""
+
+
+def montar_hierarquia(areas, chaves_semana, dias, temas, subtemas, aulas, links_aula, links_gratuitos):
+    """
+    Recebe as colunas (listas de str, todas do mesmo tamanho) das linhas já filtradas e sem
+    duplicatas e devolve o dicionário {area: [dias]}, na ordem em que as linhas aparecem.
+    """
+    # Monta as listas finais em uma única passada. Em paralelo à estrutura final, um índice
+    # guarda, para cada nó já criado, o dicionário dos seus filhos por nome; assim cada nó
+    # novo é anexado uma única vez à lista do pai e não é preciso converter nada no final.
+    cronograma_ordenado = {}
+    indice_areas = {}
+
+    linhas = zip(areas, chaves_semana, dias, temas, subtemas, aulas, links_aula, links_gratuitos)
+    for area_conhecimento, chave_semana, dia_nome, tema_nome, subtema_nome, aula, link_aula, link_gratuito in linhas:
+        indice_dias = indice_areas.get(area_conhecimento)
+        if indice_dias is None:
+            indice_dias = indice_areas[area_conhecimento] = {}
+            cronograma_ordenado[area_conhecimento] = []
+
+        no_dia = indice_dias.get(dia_nome)
+        if no_dia is None:
+            dia = {"semana": chave_semana, "nome": dia_nome, "temas": []}
+            no_dia = indice_dias[dia_nome] = (dia, {})
+            cronograma_ordenado[area_conhecimento].append(dia)
+
+        no_tema = no_dia[1].get(tema_nome)
+        if no_tema is None:
+            tema = {"nome": tema_nome, "subtemas": []}
+            no_tema = no_dia[1][tema_nome] = (tema, {})
+            no_dia[0]["temas"].append(tema)
+
+        subtema = no_tema[1].get(subtema_nome)
+        if subtema is None:
+            subtema = no_tema[1][subtema_nome] = {"nome": subtema_nome, "aulas": []}
+            no_tema[0]["subtemas"].append(subtema)
+
+        # A coluna 'aula' pode não existir na nova planilha, o que está ok.
+        subtema["aulas"].append({
+            "nome": aula,
+            "link_aula": link_aula,
+            "link_gratuito": link_gratuito
+        })
+
+    return cronograma_ordenado
@@ -0,0 +1,8 @@
+# -*- coding: utf-8 -*-
+"""
+Ponto de entrada WSGI para produção (ver Procfile).
+
+Com o gunicorn em modo --preload, o cronograma é processado uma única vez no processo
+mestre e compartilhado (copy-on-write) entre os workers.
+"""
+from app import app